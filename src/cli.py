@@ -0,0 +1,185 @@
+"""
+Command line entry point.
+
+Each subcommand imports only the modules it needs, so short invocations
+(e.g. render-pdf) do not pay for agents, httpx, trafilatura or lxml.
+"""
+import argparse
+import asyncio
+import sys
+from typing import Optional
+
+
+def _load_env() -> None:
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+def _write_json(model, output_path: Optional[str]) -> None:
+    content = model.model_dump_json(indent=2)
+    if output_path:
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(content + "\n")
+    else:
+        print(content)
+
+
+def _read_text(path: str) -> str:
+    from src.tools.txt_file import read_text_file
+    return read_text_file(path)
+
+
+def _read_resume_profile(path: str):
+    from src.models.resume_profile import ResumeProfile
+    return ResumeProfile.model_validate_json(_read_text(path))
+
+
+def _read_job_profile(path: str):
+    from src.models.job_profile import JobProfile
+    return JobProfile.model_validate_json(_read_text(path))
+
+
+def cmd_extract_resume(args: argparse.Namespace) -> None:
+    from src.pipelines.resume_extraction import resume_profile_extraction
+    from src.tools.pdf_utils import convert_resume_pdf_to_str
+
+    _load_env()
+    resume_text = convert_resume_pdf_to_str(args.resume)
+    resume_profile = asyncio.run(resume_profile_extraction(resume_text))
+    _write_json(resume_profile, args.output)
+
+
+def cmd_extract_job(args: argparse.Namespace) -> None:
+    from src.pipelines.job_profile_extraction import job_profile_extraction
+
+    _load_env()
+    if args.url:
+        from src.tools.extract_job import extract_job_from_url
+        job_text = extract_job_from_url(args.url)
+    else:
+        job_text = _read_text(args.job)
+    job_profile = asyncio.run(job_profile_extraction(job_text))
+    _write_json(job_profile, args.output)
+
+
+def cmd_score(args: argparse.Namespace) -> None:
+    from src.models.agent_input import JobAndResume
+    from src.pipelines.matching_score_pipeline import create_matching_score
+
+    _load_env()
+    agent_input = JobAndResume(
+        job_profile=_read_job_profile(args.job),
+        resume_profile=_read_resume_profile(args.resume)
+    )
+    match_results = asyncio.run(create_matching_score(agent_input))
+    _write_json(match_results, args.output)
+
+
+def cmd_tailor(args: argparse.Namespace) -> None:
+    from src.models.agent_input import JobAndResume
+    from src.pipelines.execute_plan import execute_plan
+    from src.pipelines.tailoring_plan_pipeline import create_tailoring_plan
+
+    _load_env()
+    resume_profile = _read_resume_profile(args.resume)
+    agent_input = JobAndResume(
+        job_profile=_read_job_profile(args.job),
+        resume_profile=resume_profile
+    )
+
+    async def tailor():
+        tailoring_plan = await create_tailoring_plan(agent_input)
+        return tailoring_plan, await execute_plan(tailoring_plan, resume_profile)
+
+    tailoring_plan, tailored_resume = asyncio.run(tailor())
+    if args.plan_output:
+        _write_json(tailoring_plan, args.plan_output)
+    _write_json(tailored_resume, args.output)
+
+
+def cmd_render_pdf(args: argparse.Namespace) -> None:
+    from src.tools.pdf_utils import write_resume_profile_to_pdf
+
+    write_resume_profile_to_pdf(_read_resume_profile(args.resume), args.output)
+
+
+def cmd_run(args: argparse.Namespace) -> None:
+    from src.pipelines.full_pipeline import run_full_pipeline
+    from src.tools.async_io import shutdown_pools
+    from src.tools.concurrency_governor import Priority, configure_governor, priority_lane
+
+    _load_env()
+    configure_governor(max_limit=args.max_concurrency, tokens_per_minute=args.tokens_per_minute)
+    try:
+        # asyncio.run copies the current context, so the lane applies to every call of the run
+        with priority_lane(Priority[args.priority.upper()]):
+            asyncio.run(run_full_pipeline(
+                resume_path=args.resume,
+                job_path=args.job,
+                output_dir=args.output_dir,
+                job_url=args.url
+            ))
+    finally:
+        # the pools are shared by everything on the loop, so they are shut down once the loop is done
+        shutdown_pools()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="job-fit", description="AI-powered resume tailoring and job matching.")
+    subparsers = parser.add_subparsers(dest="command")
+
+    extract_resume = subparsers.add_parser("extract-resume", help="extract a ResumeProfile JSON from a resume PDF")
+    extract_resume.add_argument("resume", help="path to the resume PDF")
+    extract_resume.add_argument("-o", "--output", help="output JSON path (default: stdout)")
+    extract_resume.set_defaults(func=cmd_extract_resume)
+
+    extract_job = subparsers.add_parser("extract-job", help="extract a JobProfile JSON from a job description")
+    job_source = extract_job.add_mutually_exclusive_group(required=True)
+    job_source.add_argument("job", nargs="?", help="path to the job description text file")
+    job_source.add_argument("--url", help="job posting URL")
+    extract_job.add_argument("-o", "--output", help="output JSON path (default: stdout)")
+    extract_job.set_defaults(func=cmd_extract_job)
+
+    score = subparsers.add_parser("score", help="score a ResumeProfile JSON against a JobProfile JSON")
+    score.add_argument("--resume", required=True, help="path to the ResumeProfile JSON")
+    score.add_argument("--job", required=True, help="path to the JobProfile JSON")
+    score.add_argument("-o", "--output", help="output JSON path (default: stdout)")
+    score.set_defaults(func=cmd_score)
+
+    tailor = subparsers.add_parser("tailor", help="tailor a ResumeProfile JSON to a JobProfile JSON")
+    tailor.add_argument("--resume", required=True, help="path to the ResumeProfile JSON")
+    tailor.add_argument("--job", required=True, help="path to the JobProfile JSON")
+    tailor.add_argument("-o", "--output", help="output JSON path for the tailored resume (default: stdout)")
+    tailor.add_argument("--plan-output", help="optional output JSON path for the tailoring plan")
+    tailor.set_defaults(func=cmd_tailor)
+
+    render_pdf = subparsers.add_parser("render-pdf", help="render a ResumeProfile JSON to PDF")
+    render_pdf.add_argument("resume", help="path to the ResumeProfile JSON")
+    render_pdf.add_argument("output", help="output PDF path")
+    render_pdf.set_defaults(func=cmd_render_pdf)
+
+    run = subparsers.add_parser("run", help="run the full pipeline (default command)")
+    run.add_argument("--resume", default="assets/input/resume_file.pdf", help="path to the resume PDF")
+    run_job_source = run.add_mutually_exclusive_group()
+    run_job_source.add_argument("--job", default="assets/input/job_file.txt",
+                                help="path to the job description text file")
+    run_job_source.add_argument("--url", help="job posting URL, used instead of --job")
+    run.add_argument("--output-dir", default="assets/output", help="directory for the tailored PDF and report")
+    run.add_argument("--max-concurrency", type=int, default=32,
+                     help="upper bound for concurrent model calls (the governor adapts below it)")
+    run.add_argument("--tokens-per-minute", type=int,
+                     help="token budget per minute for model calls (default: no budget)")
+    run.add_argument("--priority", choices=["interactive", "batch"], default="interactive",
+                     help="scheduling lane; interactive calls go ahead of queued batch calls")
+    run.set_defaults(func=cmd_run)
+
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    parser = build_parser()
+    # no subcommand keeps the original `python main.py` behaviour
+    args = parser.parse_args(argv or ["run"])
+    args.func(args)
+    return 0
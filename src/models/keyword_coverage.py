@@ -0,0 +1,26 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class TermLocation(BaseModel):
+    source: str = Field(description="where the match was found, e.g. 'skills' or a bullet id")
+    start: int
+    end: int
+    matched_text: str
+
+
+class TermCoverage(BaseModel):
+    term: str
+    canonical: str
+    locations: List[TermLocation]
+
+    @property
+    def covered(self) -> bool:
+        return bool(self.locations)
+
+
+class KeywordCoverage(BaseModel):
+    terms: List[TermCoverage]
+    covered_keywords: List[str]
+    missing_keywords: List[str]
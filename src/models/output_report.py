@@ -1,6 +1,6 @@
 from typing import List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 
 class CategoryScore(BaseModel):
     category_name: str
@@ -29,4 +29,16 @@ class MatchResults(BaseModel):
 
 class OutPutReport(BaseModel):
     base_match_result: MatchResults
-    final_match_result: MatchResults
\ No newline at end of file
+    final_match_result: MatchResults
+
+class BatchReportEntry(BaseModel):
+    job_id: str
+    job_title: str = ""
+    company: str = ""
+    base_match_result: MatchResults
+    final_match_result: MatchResults
+
+    @computed_field
+    @property
+    def score_delta(self) -> int:
+        return self.final_match_result.fit_score_overall - self.base_match_result.fit_score_overall
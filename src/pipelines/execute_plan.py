@@ -1,8 +1,9 @@
-from agents import Agent, Runner
+from agents import Agent
 from pydantic import BaseModel
 
 from src.models.resume_profile import ResumeProfile
 from src.models.tailoring_plan import TailoringPlan
+from src.tools.concurrency_governor import get_governor
 
 
 class ExecutionInput(BaseModel):
@@ -29,6 +30,6 @@ async def execute_plan(tailoring_plan: TailoringPlan, resume: ResumeProfile) ->
         resume=resume
     )
 
-    result = await Runner.run(execute_plan_agent, execution_input.model_dump_json())
+    result = await get_governor().run(execute_plan_agent, execution_input.model_dump_json())
     updated_resume: ResumeProfile = result.final_output
     return updated_resume
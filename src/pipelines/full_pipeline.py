@@ -0,0 +1,87 @@
+import asyncio
+import os
+from typing import Optional
+
+from agents import trace
+
+from src.models.agent_input import JobAndResume
+from src.models.output_report import OutPutReport
+from src.pipelines.execute_plan import execute_plan
+from src.pipelines.job_profile_extraction import job_profile_extraction
+from src.pipelines.matching_score_pipeline import create_matching_score
+from src.pipelines.resume_extraction import resume_profile_extraction
+from src.pipelines.tailoring_plan_pipeline import create_tailoring_plan
+from src.tools.async_io import (
+    EventLoopLagMonitor,
+    convert_resume_pdf_to_str_async,
+    extract_job_from_url_async,
+    run_in_thread,
+    write_output_mdfile_async,
+    write_resume_profile_to_pdf_async,
+)
+from src.tools.concurrency_governor import get_governor
+from src.tools.keyword_matcher import match_job_keywords
+from src.tools.txt_file import extract_text_from_file
+
+
+async def run_full_pipeline(resume_path: str = "assets/input/resume_file.pdf",
+                            job_path: str = "assets/input/job_file.txt",
+                            output_dir: str = "assets/output",
+                            job_url: Optional[str] = None) -> OutPutReport:
+    """
+    PDF work runs in a spawn-based process pool, so scripts calling this must guard their
+    entry code with `if __name__ == "__main__":` (the CLI does). Call
+    src.tools.async_io.shutdown_pools() once the event loop has finished.
+    """
+    with trace("Resume to Job Matching"):
+        async with EventLoopLagMonitor() as lag_monitor:
+            job_text_task = extract_job_from_url_async(job_url) if job_url else extract_text_from_file(job_path)
+            resume_text, job_description_text = await asyncio.gather(
+                convert_resume_pdf_to_str_async(resume_path),
+                job_text_task
+            )
+
+
+
+            resume_profile, job_profile = await asyncio.gather(
+                resume_profile_extraction(resume_text),
+                job_profile_extraction(job_description_text)
+            )
+
+
+
+            agent_input = JobAndResume(
+                job_profile=job_profile,
+                resume_profile=resume_profile
+            )
+
+
+            baseline_coverage = await run_in_thread(match_job_keywords, job_profile, resume_profile)
+            baseline_match_results,tailoring_plan = await asyncio.gather(
+                create_matching_score(agent_input, baseline_coverage),
+                create_tailoring_plan(agent_input, baseline_coverage)
+            )
+
+            tailored_resume = await execute_plan(tailoring_plan,resume_profile)
+
+            updated_agent_input = JobAndResume(
+                job_profile=job_profile,
+                resume_profile=tailored_resume
+            )
+
+            final_match_results = await create_matching_score(updated_agent_input)
+
+
+            output_report = OutPutReport(base_match_result=baseline_match_results,
+                                         final_match_result=final_match_results)
+
+            os.makedirs(output_dir, exist_ok=True)
+            await asyncio.gather(
+                write_resume_profile_to_pdf_async(tailored_resume, os.path.join(output_dir, "tailored_resume.pdf")),
+                write_output_mdfile_async(output_report, os.path.join(output_dir, "job_fit_report.md"))
+            )
+
+        print("Process completed. Tailored resume and report generated.")
+        print(lag_monitor.report())
+        print(get_governor().report())
+        return output_report
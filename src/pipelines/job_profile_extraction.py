@@ -1,6 +1,7 @@
-from agents import Agent, Runner
+from agents import Agent
 
 from src.models.job_profile import JobProfile
+from src.tools.concurrency_governor import get_governor
 
 
 async def job_profile_extraction(input_text: str) -> JobProfile:
@@ -13,6 +14,6 @@ async def job_profile_extraction(input_text: str) -> JobProfile:
         model="gpt-5-mini"
     )
 
-    result  = await Runner.run(job_profile_agent, input_text)
+    result  = await get_governor().run(job_profile_agent, input_text)
     job_profile : JobProfile = result.final_output
     return job_profile
\ No newline at end of file
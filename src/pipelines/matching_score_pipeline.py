@@ -1,23 +1,42 @@
-from agents import Agent, Runner
+from typing import Optional
 
-from src.models.agent_input import JobAndResume
+from agents import Agent
+
+from src.models.agent_input import JobAndResume, JobResumeAndCoverage
+from src.models.keyword_coverage import KeywordCoverage
 from src.models.job_profile import JobProfile
 from src.models.output_report import MatchResults
 from src.models.resume_profile import ResumeProfile
+from src.tools.async_io import run_in_thread
+from src.tools.keyword_matcher import match_job_keywords
+from src.tools.concurrency_governor import get_governor
 
 
-async def create_matching_score(agent_input: JobAndResume) -> MatchResults:
+async def create_matching_score(agent_input: JobAndResume,
+                                keyword_coverage: Optional[KeywordCoverage] = None) -> MatchResults:
 
 
     matching_agent = Agent(
         name="matching_agent",
-        instructions="You get a resume profile and a job profile and you need to create a matching score report between them.",
+        instructions="""You get a resume profile, a job profile and a keyword coverage report
+            and you need to create a matching score report between them.
+            The keyword coverage report is computed deterministically, treat it as the source of truth for keywords.
+        """,
         output_type=MatchResults,
         model="gpt-5-mini"
     )
 
 
 
-    result  = await Runner.run(matching_agent, agent_input.model_dump_json())
+    if keyword_coverage is None:
+        keyword_coverage = await run_in_thread(match_job_keywords, agent_input.job_profile, agent_input.resume_profile)
+    coverage_input = JobResumeAndCoverage(
+        job_profile=agent_input.job_profile,
+        resume_profile=agent_input.resume_profile,
+        keyword_coverage=keyword_coverage
+    )
+
+    result  = await get_governor().run(matching_agent, coverage_input.model_dump_json())
     match_results : MatchResults = result.final_output
+    match_results.missing_keywords = keyword_coverage.missing_keywords
     return match_results
\ No newline at end of file
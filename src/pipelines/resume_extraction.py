@@ -1,6 +1,7 @@
-from agents import Runner, Agent
+from agents import Agent
 
 from src.models.resume_profile import ResumeProfile
+from src.tools.concurrency_governor import get_governor
 
 
 async def resume_profile_extraction(text_input: str) -> ResumeProfile:
@@ -13,6 +14,6 @@ async def resume_profile_extraction(text_input: str) -> ResumeProfile:
         model="gpt-5-mini"
     )
 
-    result  = await Runner.run(resume_agent, text_input)
+    result  = await get_governor().run(resume_agent, text_input)
     resume_profile : ResumeProfile = result.final_output
     return resume_profile
\ No newline at end of file
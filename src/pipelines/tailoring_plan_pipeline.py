@@ -1,14 +1,22 @@
-from agents import Agent, Runner
+from typing import Optional
 
-from src.models.agent_input import JobAndResume
+from agents import Agent
+
+from src.models.agent_input import JobAndResume, JobResumeAndCoverage
+from src.models.keyword_coverage import KeywordCoverage
 from src.models.tailoring_plan import TailoringPlan
+from src.tools.async_io import run_in_thread
+from src.tools.keyword_matcher import match_job_keywords
+from src.tools.concurrency_governor import get_governor
 
 
-async def create_tailoring_plan(agent_input: JobAndResume) -> TailoringPlan:
+async def create_tailoring_plan(agent_input: JobAndResume,
+                                keyword_coverage: Optional[KeywordCoverage] = None) -> TailoringPlan:
 
-    instructions = """You get a resume profile and a job profile
-        and you need to create a tailoring plan       
+    instructions = """You get a resume profile, a job profile and a keyword coverage report
+        and you need to create a tailoring plan
         to improve the resume to better match the job profile.
+        Prioritize the missing keywords that the candidate's experience can honestly support.
      """
 
     tailoring_plan_agent = Agent(
@@ -17,6 +25,13 @@ async def create_tailoring_plan(agent_input: JobAndResume) -> TailoringPlan:
         output_type=TailoringPlan,
         model="gpt-5-mini"
     )
-    result = await Runner.run(tailoring_plan_agent, agent_input.model_dump_json())
+    if keyword_coverage is None:
+        keyword_coverage = await run_in_thread(match_job_keywords, agent_input.job_profile, agent_input.resume_profile)
+    coverage_input = JobResumeAndCoverage(
+        job_profile=agent_input.job_profile,
+        resume_profile=agent_input.resume_profile,
+        keyword_coverage=keyword_coverage
+    )
+    result = await get_governor().run(tailoring_plan_agent, coverage_input.model_dump_json())
     tailoring_plan: TailoringPlan = result.final_output
     return tailoring_plan
\ No newline at end of file
@@ -0,0 +1,147 @@
+import asyncio
+import functools
+import multiprocessing
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, TypeVar
+
+from src.models.output_report import OutPutReport
+from src.models.resume_profile import ResumeProfile
+
+T = TypeVar("T")
+
+_thread_pool: Optional[ThreadPoolExecutor] = None
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_thread_pool() -> ThreadPoolExecutor:
+    """Shared pool for blocking I/O (file writes, HTTP fetches)."""
+    global _thread_pool
+    if _thread_pool is None:
+        _thread_pool = ThreadPoolExecutor(thread_name_prefix="job-fit-io")
+    return _thread_pool
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Shared pool for CPU-bound work (PDF parsing and rendering).
+
+    Workers are started with spawn, which re-imports the caller's main module in every worker.
+    Scripts that end up here (directly or through run_full_pipeline) must keep their entry code
+    under `if __name__ == "__main__":`; otherwise the pool breaks and run_in_process falls back
+    to the thread pool.
+    """
+    global _process_pool
+    if _process_pool is None:
+        # spawn, not fork: the pool is first used while I/O threads are running
+        _process_pool = ProcessPoolExecutor(max_workers=min(4, os.cpu_count() or 1),
+                                            mp_context=multiprocessing.get_context("spawn"))
+    return _process_pool
+
+
+def shutdown_pools() -> None:
+    """Blocking; call it from the process entry point once the event loop has finished."""
+    global _thread_pool, _process_pool
+    if _thread_pool is not None:
+        _thread_pool.shutdown(wait=True)
+        _thread_pool = None
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=True)
+        _process_pool = None
+
+
+async def run_in_thread(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_thread_pool(), functools.partial(func, *args, **kwargs))
+
+
+async def run_in_process(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a picklable module-level function in the process pool, or in a thread if the pool is broken."""
+    global _process_pool
+    loop = asyncio.get_running_loop()
+    call = functools.partial(func, *args, **kwargs)
+    try:
+        return await loop.run_in_executor(get_process_pool(), call)
+    except BrokenProcessPool:
+        warnings.warn("Process pool workers failed to start (is the entry point missing an "
+                      "`if __name__ == \"__main__\":` guard?); running in a thread instead.", RuntimeWarning)
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=False, cancel_futures=True)
+            _process_pool = None
+        return await run_in_thread(func, *args, **kwargs)
+
+
+async def convert_resume_pdf_to_str_async(resume_path: str) -> str:
+    from src.tools.pdf_utils import convert_resume_pdf_to_str
+    return await run_in_process(convert_resume_pdf_to_str, resume_path)
+
+
+async def write_resume_profile_to_pdf_async(resume_profile: ResumeProfile, output_path: str) -> None:
+    from src.tools.pdf_utils import write_resume_profile_to_pdf
+    await run_in_process(write_resume_profile_to_pdf, resume_profile, output_path)
+
+
+async def write_output_mdfile_async(output_report: OutPutReport, output_path: str) -> None:
+    from src.tools.output_file import write_output_mdfile
+    await run_in_thread(write_output_mdfile, output_report, output_path)
+
+
+async def extract_job_from_url_async(url: str) -> str:
+    from src.tools.extract_job import extract_job_from_url
+    return await run_in_thread(extract_job_from_url, url)
+
+
+class EventLoopLagMonitor:
+    """
+    Measure how late the event loop wakes up a periodic sleeper.
+
+    Any lag well above zero means something is blocking the loop
+    and stalling all in-flight agent calls.
+    """
+
+    def __init__(self, interval: float = 0.05) -> None:
+        self.interval = interval
+        self.samples = 0
+        self.total_lag = 0.0
+        self.max_lag = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - expected)
+            self.samples += 1
+            self.total_lag += lag
+            self.max_lag = max(self.max_lag, lag)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @property
+    def mean_lag(self) -> float:
+        return self.total_lag / self.samples if self.samples else 0.0
+
+    def report(self) -> str:
+        return (f"Event loop lag: mean {self.mean_lag * 1000:.1f} ms, "
+                f"max {self.max_lag * 1000:.1f} ms over {self.samples} samples")
+
+    async def __aenter__(self) -> "EventLoopLagMonitor":
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.stop()
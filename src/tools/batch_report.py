@@ -0,0 +1,198 @@
+import bisect
+import csv
+import io
+import json
+import os
+import time
+from datetime import datetime
+from typing import NamedTuple, Optional, TextIO
+
+from src.models.output_report import BatchReportEntry
+
+
+class LeaderboardRow(NamedTuple):
+    score_delta: int
+    job_id: str
+    job_title: str
+    company: str
+    base_score: int
+    final_score: int
+
+
+def _leaderboard_key(row: LeaderboardRow) -> tuple:
+    return -row.score_delta, -row.final_score, row.job_id
+
+
+def _escape_md_cell(value: str) -> str:
+    return value.replace("|", "\\|").replace("\n", " ")
+
+
+def _replace_file(output_path: str, content: str) -> None:
+    """Write to a temp file and rename it, so readers never see a half-written file."""
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+        f.write(content)
+    os.replace(tmp_path, output_path)
+
+
+class BatchReportWriter:
+    """
+    Streaming report writer for batch runs.
+
+    Every `append` writes the job's full baseline/final MatchResults as one JSONL line
+    and keeps a small LeaderboardRow in sorted order. The MatchResults are not kept in memory,
+    but the leaderboard is: memory and the cost of each leaderboard rewrite grow by one row per job
+    (a few hundred bytes), which is the price of a complete ranking. The JSONL file itself is
+    only ever appended to.
+    The Markdown/CSV leaderboards are rewritten at most every `leaderboard_interval` seconds
+    and on `close`, so partial results stay readable while the batch is running.
+
+    An existing JSONL report is appended to (and its rows reloaded) unless `overwrite=True`,
+    so a restarted batch does not lose what was already streamed. A trailing line cut off by a
+    crash is dropped. Re-running a job replaces its leaderboard row (latest result wins) while
+    both results stay in the JSONL file.
+
+    Usage, one entry per finished job:
+
+        with BatchReportWriter("assets/output/batch") as report:
+            for job_id, base, final in results:
+                report.append(BatchReportEntry(job_id=job_id, base_match_result=base,
+                                               final_match_result=final))
+    """
+
+    def __init__(self, output_dir: str, name: str = "batch_report",
+                 overwrite: bool = False, leaderboard_interval: float = 5.0) -> None:
+        os.makedirs(output_dir, exist_ok=True)
+        self.jsonl_path = os.path.join(output_dir, f"{name}.jsonl")
+        self.md_path = os.path.join(output_dir, f"{name}_leaderboard.md")
+        self.csv_path = os.path.join(output_dir, f"{name}_leaderboard.csv")
+        self.leaderboard_interval = leaderboard_interval
+        self._rows: list[LeaderboardRow] = []
+        self._row_by_job: dict[str, LeaderboardRow] = {}
+        self._started_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._last_leaderboard_write = float("-inf")
+        self._leaderboard_dirty = False
+
+        if not overwrite and os.path.exists(self.jsonl_path):
+            self._drop_partial_last_line()
+            self._load_rows()
+        self._jsonl_file: Optional[TextIO] = open(self.jsonl_path, "w" if overwrite else "a", encoding="utf-8")
+
+    def _drop_partial_last_line(self) -> None:
+        """Truncate a last line without its newline, left behind when a run died mid-write."""
+        with open(self.jsonl_path, "rb+") as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            if size == 0:
+                return
+            f.seek(size - 1)
+            if f.read(1) == b"\n":
+                return
+            # walk back to the previous newline
+            position = size - 1
+            while position > 0:
+                chunk_start = max(0, position - 4096)
+                f.seek(chunk_start)
+                chunk = f.read(position - chunk_start)
+                newline = chunk.rfind(b"\n")
+                if newline != -1:
+                    f.truncate(chunk_start + newline + 1)
+                    return
+                position = chunk_start
+            f.truncate(0)
+
+    def _add_row(self, row: LeaderboardRow) -> None:
+        previous = self._row_by_job.get(row.job_id)
+        if previous is not None:
+            del self._rows[bisect.bisect_left(self._rows, _leaderboard_key(previous), key=_leaderboard_key)]
+        self._row_by_job[row.job_id] = row
+        bisect.insort(self._rows, row, key=_leaderboard_key)
+
+    def _load_rows(self) -> None:
+        with open(self.jsonl_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                data = json.loads(line)
+                base_score = data["base_match_result"]["fit_score_overall"]
+                final_score = data["final_match_result"]["fit_score_overall"]
+                self._add_row(LeaderboardRow(
+                    score_delta=final_score - base_score,
+                    job_id=data["job_id"],
+                    job_title=data.get("job_title", ""),
+                    company=data.get("company", ""),
+                    base_score=base_score,
+                    final_score=final_score,
+                ))
+        self._leaderboard_dirty = bool(self._rows)
+
+    @property
+    def rows(self) -> list[LeaderboardRow]:
+        return list(self._rows)
+
+    def append(self, entry: BatchReportEntry) -> None:
+        if self._jsonl_file is None:
+            raise ValueError("BatchReportWriter is closed.")
+
+        self._jsonl_file.write(entry.model_dump_json() + "\n")
+        self._jsonl_file.flush()
+
+        self._add_row(LeaderboardRow(
+            score_delta=entry.score_delta,
+            job_id=entry.job_id,
+            job_title=entry.job_title,
+            company=entry.company,
+            base_score=entry.base_match_result.fit_score_overall,
+            final_score=entry.final_match_result.fit_score_overall,
+        ))
+        self._leaderboard_dirty = True
+
+        if time.monotonic() - self._last_leaderboard_write >= self.leaderboard_interval:
+            self.write_leaderboard()
+
+    def write_leaderboard(self) -> None:
+        if not self._leaderboard_dirty:
+            return
+        _replace_file(self.md_path, self._render_leaderboard_md())
+        _replace_file(self.csv_path, self._render_leaderboard_csv())
+        self._last_leaderboard_write = time.monotonic()
+        self._leaderboard_dirty = False
+
+    def close(self) -> None:
+        if self._jsonl_file is not None:
+            self.write_leaderboard()
+            self._jsonl_file.close()
+            self._jsonl_file = None
+
+    def __enter__(self) -> "BatchReportWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _render_leaderboard_md(self) -> str:
+        updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        lines: list[str] = []
+        lines.append("# Job Fit Leaderboard")
+        lines.append("")
+        lines.append(f"_Started at: {self._started_at} | Updated at: {updated_at} | Jobs: {len(self._rows)}_")
+        lines.append("")
+        lines.append("| Rank | Job | Title | Company | Base | Final | Delta |")
+        lines.append("|---|---|---|---|---|---|---|")
+        for rank, row in enumerate(self._rows, start=1):
+            lines.append(
+                f"| {rank} | {_escape_md_cell(row.job_id)} | {_escape_md_cell(row.job_title)} "
+                f"| {_escape_md_cell(row.company)} | {row.base_score} | {row.final_score} | {row.score_delta:+d} |"
+            )
+
+        return "\n".join(lines) + "\n"
+
+    def _render_leaderboard_csv(self) -> str:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(["rank", "job_id", "job_title", "company", "base_score", "final_score", "score_delta"])
+        for rank, row in enumerate(self._rows, start=1):
+            writer.writerow([rank, row.job_id, row.job_title, row.company,
+                             row.base_score, row.final_score, row.score_delta])
+        return buffer.getvalue()
@@ -0,0 +1,239 @@
+import asyncio
+import heapq
+import itertools
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class Priority(IntEnum):
+    INTERACTIVE = 0
+    BATCH = 1
+
+
+_current_priority: ContextVar[Priority] = ContextVar("job_fit_priority", default=Priority.INTERACTIVE)
+
+
+@contextmanager
+def priority_lane(priority: Priority) -> Iterator[None]:
+    """Run every governed call made inside this block (and tasks it spawns) in the given lane."""
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    if getattr(exc, "status_code", None) == 429:
+        return True
+    return type(exc).__name__ == "RateLimitError"
+
+
+class ConcurrencyGovernor:
+    """
+    Shared scheduler for model calls with AIMD concurrency control.
+
+    - The concurrency limit grows by ~1 per round of healthy calls that ran while every slot was
+      taken (so light load does not inflate it), and is multiplied by
+      `decrease_factor` on a 429 or when latency spikes above `latency_spike_factor` x average.
+      The latency average is kept per stage (agent name), so a long tailoring call is not
+      compared against short extraction calls.
+    - An optional tokens-per-minute budget is enforced with a token bucket.
+    - Waiters are served by priority lane, so interactive calls go ahead of queued batch work.
+    - Rate-limited calls are retried with exponential backoff.
+    """
+
+    def __init__(self,
+                 initial_limit: int = 4,
+                 min_limit: int = 1,
+                 max_limit: int = 32,
+                 tokens_per_minute: Optional[int] = None,
+                 decrease_factor: float = 0.5,
+                 latency_spike_factor: float = 3.0,
+                 max_retries: int = 5,
+                 base_backoff: float = 1.0,
+                 max_backoff: float = 30.0) -> None:
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = float(min(max(initial_limit, min_limit), max_limit))
+        self.tokens_per_minute = tokens_per_minute
+        self.decrease_factor = decrease_factor
+        self.latency_spike_factor = latency_spike_factor
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+
+        self.in_flight = 0
+        self.rate_limited_count = 0
+        self.latency_avg: Dict[str, float] = {}
+        self._last_decrease = 0.0
+
+        self._tokens_available = float(tokens_per_minute or 0)
+        self._last_refill = time.monotonic()
+
+        self._waiters: list[tuple[int, int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+
+    # ---- token budget ----
+
+    def _refill_tokens(self) -> None:
+        if not self.tokens_per_minute:
+            return
+        now = time.monotonic()
+        self._tokens_available = min(
+            float(self.tokens_per_minute),
+            self._tokens_available + (now - self._last_refill) * self.tokens_per_minute / 60.0
+        )
+        self._last_refill = now
+
+    def _clamp_tokens(self, tokens: int) -> int:
+        if self.tokens_per_minute:
+            return min(tokens, self.tokens_per_minute)
+        return tokens
+
+    # ---- slots ----
+
+    def _dispatch(self) -> None:
+        self._wakeup = None
+        self._refill_tokens()
+        while self._waiters and self.in_flight < int(self.limit):
+            _, _, tokens, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if self.tokens_per_minute and tokens > self._tokens_available:
+                # head of line waits for the budget, lower lanes must not overtake it
+                delay = (tokens - self._tokens_available) * 60.0 / self.tokens_per_minute
+                self._wakeup = asyncio.get_running_loop().call_later(delay, self._dispatch)
+                return
+            heapq.heappop(self._waiters)
+            self.in_flight += 1
+            if self.tokens_per_minute:
+                self._tokens_available -= tokens
+            future.set_result(self.in_flight >= int(self.limit))
+
+    async def acquire(self, estimated_tokens: int = 0, priority: Optional[Priority] = None) -> bool:
+        """Wait for a slot. Returns True when the slot was the last free one (the governor is saturated)."""
+        priority = _current_priority.get() if priority is None else priority
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._seq), self._clamp_tokens(estimated_tokens), future))
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+        self._dispatch()
+        try:
+            return await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release(estimated_tokens=estimated_tokens, used_tokens=0)
+            raise
+
+    def release(self,
+                latency: Optional[float] = None,
+                rate_limited: bool = False,
+                estimated_tokens: int = 0,
+                used_tokens: Optional[int] = None,
+                stage: str = "default",
+                saturated: bool = False) -> None:
+        self.in_flight -= 1
+        if self.tokens_per_minute and used_tokens is not None:
+            self._tokens_available -= self._clamp_tokens(used_tokens) - self._clamp_tokens(estimated_tokens)
+
+        if rate_limited:
+            self.rate_limited_count += 1
+            self._decrease(stage)
+        elif latency is not None:
+            stage_avg = self.latency_avg.get(stage)
+            if stage_avg is not None and latency > stage_avg * self.latency_spike_factor:
+                self._decrease(stage)
+            elif saturated:
+                self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+            self.latency_avg[stage] = latency if stage_avg is None else 0.8 * stage_avg + 0.2 * latency
+
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+        self._dispatch()
+
+    def _decrease(self, stage: str) -> None:
+        # one decrease per round trip, so a burst of 429s from the same wave only halves once
+        now = time.monotonic()
+        if now - self._last_decrease < self.latency_avg.get(stage, 1.0):
+            return
+        self._last_decrease = now
+        self.limit = max(float(self.min_limit), self.limit * self.decrease_factor)
+
+    # ---- calls ----
+
+    async def call(self,
+                   func: Callable[[], Awaitable[T]],
+                   estimated_tokens: int = 0,
+                   priority: Optional[Priority] = None,
+                   tokens_used: Optional[Callable[[T], Optional[int]]] = None,
+                   stage: str = "default") -> T:
+        """Run `func` under the governor, retrying with backoff when it gets rate limited."""
+        for attempt in range(self.max_retries + 1):
+            saturated = await self.acquire(estimated_tokens, priority)
+            start = time.monotonic()
+            try:
+                result = await func()
+            except Exception as exc:
+                rate_limited = is_rate_limit_error(exc)
+                self.release(rate_limited=rate_limited, estimated_tokens=estimated_tokens, stage=stage)
+                if not rate_limited or attempt == self.max_retries:
+                    raise
+                backoff = min(self.max_backoff, self.base_backoff * 2 ** attempt)
+                await asyncio.sleep(backoff * random.uniform(0.5, 1.0))
+                continue
+            except BaseException:
+                self.release(estimated_tokens=estimated_tokens)
+                raise
+
+            used = tokens_used(result) if tokens_used else None
+            self.release(latency=time.monotonic() - start, estimated_tokens=estimated_tokens,
+                         used_tokens=used, stage=stage, saturated=saturated)
+            return result
+
+    async def run(self, agent: Any, agent_input: str, priority: Optional[Priority] = None,
+                  estimated_tokens: Optional[int] = None) -> Any:
+        """Governed `Runner.run`. Token estimate defaults to ~4 chars per token plus room for the output."""
+        from agents import Runner
+
+        if estimated_tokens is None:
+            estimated_tokens = len(agent_input) // 4 + 2000
+        return await self.call(lambda: Runner.run(agent, agent_input),
+                               estimated_tokens=estimated_tokens,
+                               priority=priority,
+                               tokens_used=_run_result_tokens,
+                               stage=getattr(agent, "name", "default"))
+
+    def report(self) -> str:
+        return (f"Concurrency limit {self.limit:.1f}, in flight {self.in_flight}, queued {len(self._waiters)}, "
+                f"rate limited {self.rate_limited_count}")
+
+
+def _run_result_tokens(result: Any) -> Optional[int]:
+    usage = getattr(getattr(result, "context_wrapper", None), "usage", None)
+    return getattr(usage, "total_tokens", None)
+
+
+_governor: Optional[ConcurrencyGovernor] = None
+
+
+def get_governor() -> ConcurrencyGovernor:
+    global _governor
+    if _governor is None:
+        _governor = ConcurrencyGovernor()
+    return _governor
+
+
+def configure_governor(**kwargs: Any) -> ConcurrencyGovernor:
+    """Replace the shared governor, e.g. `configure_governor(max_limit=8, tokens_per_minute=200_000)`."""
+    global _governor
+    _governor = ConcurrencyGovernor(**kwargs)
+    return _governor
@@ -1,13 +1,15 @@
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 import json
 import re
 
-import httpx
-import trafilatura
-import lxml.html
+# httpx, trafilatura and lxml are imported where they are used, so importing this module stays cheap
+if TYPE_CHECKING:
+    import lxml.html
 
 
 def _fetch_html(url: str, timeout: float = 20.0) -> str:
+    import httpx
+
     headers = {
         "User-Agent": (
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -25,7 +27,7 @@ def _fetch_html(url: str, timeout: float = 20.0) -> str:
         return resp.text
 
 
-def _extract_from_json_ld(tree: lxml.html.HtmlElement) -> dict:
+def _extract_from_json_ld(tree: "lxml.html.HtmlElement") -> dict:
     """Try to find a JobPosting object inside JSON-LD script tags using lxml."""
     scripts = tree.xpath('//script[@type="application/ld+json"]/text()')
     for script_text in scripts:
@@ -67,6 +69,9 @@ def extract_job_from_url(url: str) -> str:
 
     Returns a human-readable plain text string containing Title, Company, Location and Description.
     """
+    import lxml.html
+    import trafilatura
+
     html = _fetch_html(url)
     if not html:
         return ""
@@ -0,0 +1,289 @@
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from src.models.job_profile import JobProfile
+from src.models.keyword_coverage import KeywordCoverage, TermCoverage, TermLocation
+from src.models.resume_profile import ResumeProfile
+
+
+# canonical name -> variants that mean the same thing
+DEFAULT_SYNONYMS: Dict[str, List[str]] = {
+    "kubernetes": ["k8s", "kube"],
+    "postgresql": ["postgres", "psql", "pgsql"],
+    "javascript": ["js", "ecmascript", "es6"],
+    "node.js": ["nodejs", "node js"],
+    "react": ["react.js", "reactjs", "react js"],
+    "vue": ["vue.js", "vuejs"],
+    "next.js": ["nextjs", "next js"],
+    "golang": ["go lang"],
+    "c#": ["csharp", "c sharp"],
+    "c++": ["cpp", "cplusplus"],
+    "python": ["python3"],
+    "amazon web services": ["aws"],
+    "google cloud platform": ["gcp", "google cloud"],
+    "microsoft azure": ["azure"],
+    "mongodb": ["mongo"],
+    "elasticsearch": ["elastic search"],
+    "ci/cd": ["ci cd", "cicd"],
+    "machine learning": ["ml"],
+    "artificial intelligence": ["ai"],
+    "natural language processing": ["nlp"],
+    "large language models": ["llm", "llms", "large language model"],
+    "rest api": ["rest apis", "restful", "restful api", "restful apis"],
+    "graphql": ["graph ql"],
+    "microservices": ["microservice", "micro services", "micro service"],
+    "infrastructure as code": ["iac"],
+    "sql": ["structured query language"],
+    "nosql": ["no sql"],
+    "test driven development": ["tdd"],
+    "object oriented programming": ["oop", "object oriented"],
+    "user experience": ["ux"],
+    "user interface": ["ui"],
+}
+
+# variants that are ordinary words in prose ("go-to-market", "let's go"), so they only count
+# when a whole skill/technology item is exactly that word
+LIST_ITEM_SYNONYMS: Dict[str, List[str]] = {
+    "golang": ["go"],
+}
+
+
+# "." is kept inside tokens (node.js, asp.net) so "js" never matches inside "node.js"
+_BOUNDARY_CHARS = " /"
+
+
+def normalize_with_offsets(text: str) -> Tuple[str, List[int]]:
+    """
+    Lowercase the text and collapse punctuation into single spaces.
+    Keeps '+' and '#' (c++, c#), '/' between words (ci/cd) and '.' between words (node.js).
+    Returns the normalized text and, for each of its chars, the offset in the original text.
+    """
+    chars: list[str] = []
+    offsets: list[int] = []
+    length = len(text)
+    for i, ch in enumerate(text):
+        c = ch.lower()
+        if c.isalnum() or c in "+#":
+            chars.append(c)
+            offsets.append(i)
+        elif c in "./" and chars and chars[-1] != " " and i + 1 < length and text[i + 1].isalnum():
+            chars.append(c)
+            offsets.append(i)
+        elif chars and chars[-1] != " ":
+            chars.append(" ")
+            offsets.append(i)
+    if chars and chars[-1] == " ":
+        chars.pop()
+        offsets.pop()
+    return "".join(chars), offsets
+
+
+def normalize(text: str) -> str:
+    return normalize_with_offsets(text)[0]
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over a set of job terms and all of their synonyms.
+
+    Build it once per job (or once for a whole batch of terms) and scan any number
+    of texts; each scan is linear in the text length plus the number of matches.
+    Matches only count on word boundaries, so "java" does not match inside "javascript",
+    and overlapping matches resolve leftmost-longest, so "node.js" is not also "javascript".
+    """
+
+    def __init__(self, terms: Iterable[str], synonyms: Dict[str, List[str]] = DEFAULT_SYNONYMS,
+                 list_item_synonyms: Dict[str, List[str]] = LIST_ITEM_SYNONYMS) -> None:
+        variant_to_canonical: Dict[str, str] = {}
+        canonical_variants: Dict[str, set[str]] = {}
+        for canonical, variants in synonyms.items():
+            norm_canonical = normalize(canonical)
+            canonical_variants[norm_canonical] = {norm_canonical, *(normalize(v) for v in variants)}
+            for variant in canonical_variants[norm_canonical]:
+                variant_to_canonical.setdefault(variant, norm_canonical)
+
+        list_item_variants: Dict[str, str] = {}
+        for canonical, variants in list_item_synonyms.items():
+            norm_canonical = normalize(canonical)
+            canonical_variants.setdefault(norm_canonical, {norm_canonical})
+            for variant in variants:
+                list_item_variants[normalize(variant)] = norm_canonical
+                variant_to_canonical.setdefault(normalize(variant), norm_canonical)
+
+        # canonical -> the original job terms that map onto it
+        self.terms_by_canonical: Dict[str, List[str]] = {}
+        for term in terms:
+            norm_term = normalize(term)
+            if not norm_term:
+                continue
+            canonical = variant_to_canonical.get(norm_term, norm_term)
+            known_terms = self.terms_by_canonical.setdefault(canonical, [])
+            if term not in known_terms:
+                known_terms.append(term)
+
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[Tuple[str, int]]] = [[]]  # (canonical, pattern length)
+        self._dict_link: list[int] = [0]
+
+        # whole-item variants never go into the automaton, so they cannot match inside prose
+        self._list_item_variants: Dict[str, str] = {
+            variant: canonical for variant, canonical in list_item_variants.items()
+            if canonical in self.terms_by_canonical
+        }
+
+        for canonical in self.terms_by_canonical:
+            for pattern in canonical_variants.get(canonical, {canonical}):
+                if pattern not in self._list_item_variants:
+                    self._add_pattern(pattern, canonical)
+        self._build_links()
+
+    def _add_pattern(self, pattern: str, canonical: str) -> None:
+        state = 0
+        for ch in pattern:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._dict_link.append(0)
+                self._goto[state][ch] = next_state
+            state = next_state
+        if (canonical, len(pattern)) not in self._output[state]:
+            self._output[state].append((canonical, len(pattern)))
+
+    def _build_links(self) -> None:
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                fail_state = self._goto[fallback].get(ch, 0)
+                self._fail[child] = fail_state
+                self._dict_link[child] = fail_state if self._output[fail_state] else self._dict_link[fail_state]
+
+    def scan(self, text: str) -> Iterator[Tuple[str, int, int]]:
+        """Yield (canonical, start, end) for every whole-word match, as offsets into the original text."""
+        norm_text, offsets = normalize_with_offsets(text)
+        # candidates come out ordered by end position; keep the leftmost-longest non-overlapping ones
+        candidates = sorted(self._candidates(norm_text), key=lambda m: (m[1], m[1] - m[2]))
+        last_end = 0
+        chosen_span: Tuple[int, int] = (-1, -1)
+        seen: set[Tuple[str, int, int]] = set()
+        for canonical, start, end in candidates:
+            if (start, end) != chosen_span:
+                if start < last_end:
+                    continue
+                chosen_span = (start, end)
+                last_end = end
+            if (canonical, start, end) in seen:
+                continue
+            seen.add((canonical, start, end))
+            yield canonical, offsets[start], offsets[end - 1] + 1
+
+    def _candidates(self, norm_text: str) -> Iterator[Tuple[str, int, int]]:
+        """All whole-word matches as (canonical, start, end) in normalized-text offsets."""
+        length = len(norm_text)
+        state = 0
+        for i, ch in enumerate(norm_text):
+            while state and ch not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(ch, 0)
+
+            if i + 1 < length and norm_text[i + 1] not in _BOUNDARY_CHARS:
+                continue
+
+            match_state = state
+            while match_state:
+                for canonical, pattern_length in self._output[match_state]:
+                    start = i - pattern_length + 1
+                    if start == 0 or norm_text[start - 1] in _BOUNDARY_CHARS:
+                        yield canonical, start, i + 1
+                match_state = self._dict_link[match_state]
+
+    def coverage(self, sections: Iterable[Tuple[str, str]],
+                 list_items: Iterable[Tuple[str, str]] = ()) -> KeywordCoverage:
+        """
+        Scan (source, text) sections once and report which job terms are covered and where.
+        `list_items` are single skill/technology entries; they are scanned the same way and
+        can also match LIST_ITEM_SYNONYMS as a whole.
+        """
+        locations: Dict[str, List[TermLocation]] = {canonical: [] for canonical in self.terms_by_canonical}
+        for source, text in sections:
+            if not text:
+                continue
+            for canonical, start, end in self.scan(text):
+                locations[canonical].append(
+                    TermLocation(source=source, start=start, end=end, matched_text=text[start:end])
+                )
+        for source, text in list_items:
+            if not text:
+                continue
+            for canonical, start, end in self.scan(text):
+                locations[canonical].append(
+                    TermLocation(source=source, start=start, end=end, matched_text=text[start:end])
+                )
+            canonical = self._list_item_variants.get(normalize(text))
+            if canonical is not None:
+                locations[canonical].append(
+                    TermLocation(source=source, start=0, end=len(text), matched_text=text)
+                )
+
+        terms: list[TermCoverage] = []
+        covered_keywords: list[str] = []
+        missing_keywords: list[str] = []
+        for canonical, job_terms in self.terms_by_canonical.items():
+            for term in job_terms:
+                term_coverage = TermCoverage(term=term, canonical=canonical, locations=locations[canonical])
+                terms.append(term_coverage)
+                (covered_keywords if term_coverage.covered else missing_keywords).append(term)
+
+        return KeywordCoverage(terms=terms, covered_keywords=covered_keywords, missing_keywords=missing_keywords)
+
+
+def job_terms(job_profile: JobProfile) -> list[str]:
+    terms: list[str] = []
+    terms.extend(skill.name for skill in job_profile.must_haves)
+    terms.extend(skill.name for skill in job_profile.nice_to_haves)
+    terms.extend(job_profile.keywords)
+    return terms
+
+
+def resume_sections(resume_profile: ResumeProfile) -> Iterator[Tuple[str, str]]:
+    """Free-text parts of the resume."""
+    if resume_profile.summary:
+        yield "summary", resume_profile.summary
+    for exp in resume_profile.experiences:
+        yield exp.id, exp.role
+        for bullet in exp.bullets:
+            yield bullet.id, bullet.content
+    for project in resume_profile.projects:
+        yield project.name, project.description
+
+
+def resume_list_items(resume_profile: ResumeProfile) -> Iterator[Tuple[str, str]]:
+    """Single skill/technology entries of the resume."""
+    for skill in resume_profile.skills:
+        yield "skills", skill
+    for exp in resume_profile.experiences:
+        for technology in exp.technologies:
+            yield exp.id, technology
+    for project in resume_profile.projects:
+        for technology in project.technologies:
+            yield project.name, technology
+
+
+@lru_cache(maxsize=256)
+def get_keyword_matcher(terms: Tuple[str, ...]) -> KeywordMatcher:
+    """Compiled matcher per job term set, so the same job is not recompiled for every resume or stage."""
+    return KeywordMatcher(terms)
+
+
+def match_job_keywords(job_profile: JobProfile, resume_profile: ResumeProfile) -> KeywordCoverage:
+    matcher = get_keyword_matcher(tuple(job_terms(job_profile)))
+    return matcher.coverage(resume_sections(resume_profile), resume_list_items(resume_profile))
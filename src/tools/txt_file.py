@@ -1,7 +1,12 @@
 
 
-async def extract_text_from_file(file_path: str) -> str:
-    """Extract text from a .txt file."""
+def read_text_file(file_path: str) -> str:
     with open(file_path, 'r', encoding='utf-8') as file:
         text = file.read()
     return text
+
+
+async def extract_text_from_file(file_path: str) -> str:
+    """Extract text from a .txt file without blocking the event loop."""
+    from src.tools.async_io import run_in_thread
+    return await run_in_thread(read_text_file, file_path)
@@ -0,0 +1,40 @@
+import asyncio
+from typing import Optional
+
+
+class FakeRateLimitError(Exception):
+    status_code = 429
+
+
+class FakeRateLimitedModel:
+    """
+    Local stand-in for a model provider.
+
+    Answers after `latency` seconds and raises a 429 when more than `capacity` calls are in flight,
+    which is what the provider does when it is rate limiting.
+    """
+
+    def __init__(self, capacity: int, latency: float = 0.02) -> None:
+        self.capacity = capacity
+        self.latency = latency
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+        self.rate_limited = 0
+        self.completed: list[str] = []
+
+    async def __call__(self, tag: str, latency: Optional[float] = None) -> str:
+        self.calls += 1
+        if self.active >= self.capacity:
+            self.rate_limited += 1
+            await asyncio.sleep(0.001)
+            raise FakeRateLimitError(f"{tag}: too many concurrent requests")
+
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.latency if latency is None else latency)
+            self.completed.append(tag)
+            return tag
+        finally:
+            self.active -= 1
@@ -0,0 +1,81 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from src.tools.async_io import (
+    EventLoopLagMonitor,
+    get_process_pool,
+    get_thread_pool,
+    run_in_process,
+    run_in_thread,
+    shutdown_pools,
+)
+
+
+@pytest.fixture(autouse=True)
+def _shutdown_pools():
+    yield
+    shutdown_pools()
+
+
+def test_lag_monitor_reports_blocked_loop():
+    async def scenario():
+        async with EventLoopLagMonitor(interval=0.01) as monitor:
+            await asyncio.sleep(0.05)
+            time.sleep(0.2)
+            await asyncio.sleep(0.05)
+        return monitor
+
+    monitor = asyncio.run(scenario())
+    assert monitor.max_lag >= 0.15
+
+
+def test_lag_monitor_is_near_zero_on_idle_loop():
+    async def scenario():
+        async with EventLoopLagMonitor(interval=0.01) as monitor:
+            await asyncio.sleep(0.2)
+        return monitor
+
+    monitor = asyncio.run(scenario())
+    assert monitor.samples > 5
+    assert monitor.max_lag < 0.05
+
+
+def test_lag_monitor_task_stops_on_error():
+    async def scenario():
+        monitor = EventLoopLagMonitor(interval=0.01)
+        with pytest.raises(RuntimeError):
+            async with monitor:
+                raise RuntimeError("boom")
+        return monitor
+
+    assert asyncio.run(scenario())._task is None
+
+
+@pytest.mark.parametrize("offload", [run_in_thread, run_in_process])
+def test_offloaded_call_does_not_stall_concurrent_sleeper(offload):
+    async def scenario():
+        # warm the pool up so worker startup is not part of the measurement
+        await offload(os.getpid)
+        async with EventLoopLagMonitor(interval=0.01) as monitor:
+            await offload(time.sleep, 0.3)
+        return monitor
+
+    monitor = asyncio.run(scenario())
+    assert monitor.samples > 10
+    assert monitor.max_lag < 0.1
+
+
+def test_run_in_process_uses_another_process():
+    assert asyncio.run(run_in_process(os.getpid)) != os.getpid()
+
+
+def test_shutdown_pools_replaces_shared_pools():
+    thread_pool, process_pool = get_thread_pool(), get_process_pool()
+    assert get_thread_pool() is thread_pool
+    shutdown_pools()
+    assert get_thread_pool() is not thread_pool
+    assert get_process_pool() is not process_pool
+    assert asyncio.run(run_in_thread(os.getpid)) == os.getpid()
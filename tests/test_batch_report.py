@@ -0,0 +1,99 @@
+import csv
+import json
+
+from src.models.output_report import BatchReportEntry, MatchResults
+from src.tools.batch_report import BatchReportWriter
+
+
+def _match(score: int) -> MatchResults:
+    return MatchResults(fit_score_overall=score, fit_score_by_category=[], missing_keywords=[], evidence="")
+
+
+def _entry(job_id: str, base: int, final: int) -> BatchReportEntry:
+    return BatchReportEntry(job_id=job_id, job_title=f"{job_id} title", company="Acme",
+                            base_match_result=_match(base), final_match_result=_match(final))
+
+
+def _read_jsonl(path: str) -> list[dict]:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def _read_csv_job_ids(path: str) -> list[str]:
+    with open(path, encoding="utf-8", newline="") as f:
+        return [row["job_id"] for row in csv.DictReader(f)]
+
+
+def test_streams_jsonl_and_leaderboard_while_open(tmp_path):
+    writer = BatchReportWriter(str(tmp_path), leaderboard_interval=0)
+    writer.append(_entry("job-a", 50, 60))
+    writer.append(_entry("job-b", 40, 80))
+    writer.append(_entry("job-c", 70, 70))
+
+    lines = _read_jsonl(writer.jsonl_path)
+    assert [line["job_id"] for line in lines] == ["job-a", "job-b", "job-c"]
+    assert [line["score_delta"] for line in lines] == [10, 40, 0]
+
+    assert _read_csv_job_ids(writer.csv_path) == ["job-b", "job-a", "job-c"]
+    with open(writer.md_path, encoding="utf-8") as f:
+        md = f.read()
+    assert md.index("job-b") < md.index("job-a") < md.index("job-c")
+    writer.close()
+
+
+def test_leaderboard_rewrites_are_throttled_until_close(tmp_path):
+    writer = BatchReportWriter(str(tmp_path), leaderboard_interval=3600)
+    writer.append(_entry("job-a", 50, 60))
+    writer.append(_entry("job-b", 40, 80))
+    assert _read_csv_job_ids(writer.csv_path) == ["job-a"]
+
+    writer.close()
+    assert _read_csv_job_ids(writer.csv_path) == ["job-b", "job-a"]
+
+
+def test_restart_appends_instead_of_truncating(tmp_path):
+    with BatchReportWriter(str(tmp_path)) as writer:
+        writer.append(_entry("job-a", 50, 60))
+
+    with BatchReportWriter(str(tmp_path)) as writer:
+        writer.append(_entry("job-b", 40, 80))
+        assert [row.job_id for row in writer.rows] == ["job-b", "job-a"]
+
+    assert [line["job_id"] for line in _read_jsonl(writer.jsonl_path)] == ["job-a", "job-b"]
+    assert _read_csv_job_ids(writer.csv_path) == ["job-b", "job-a"]
+
+
+def test_overwrite_starts_a_fresh_report(tmp_path):
+    with BatchReportWriter(str(tmp_path)) as writer:
+        writer.append(_entry("job-a", 50, 60))
+
+    with BatchReportWriter(str(tmp_path), overwrite=True) as writer:
+        writer.append(_entry("job-b", 40, 80))
+
+    assert [line["job_id"] for line in _read_jsonl(writer.jsonl_path)] == ["job-b"]
+
+
+def test_restart_drops_partial_trailing_line(tmp_path):
+    with BatchReportWriter(str(tmp_path)) as writer:
+        writer.append(_entry("job-a", 50, 60))
+    with open(writer.jsonl_path, "a", encoding="utf-8") as f:
+        f.write('{"job_id": "job-b", "base_match')
+
+    with BatchReportWriter(str(tmp_path)) as writer:
+        assert [row.job_id for row in writer.rows] == ["job-a"]
+        writer.append(_entry("job-c", 10, 90))
+
+    assert [line["job_id"] for line in _read_jsonl(writer.jsonl_path)] == ["job-a", "job-c"]
+
+
+def test_rerun_job_replaces_its_leaderboard_row(tmp_path):
+    with BatchReportWriter(str(tmp_path)) as writer:
+        writer.append(_entry("job-a", 50, 60))
+        writer.append(_entry("job-b", 40, 80))
+
+    with BatchReportWriter(str(tmp_path)) as writer:
+        writer.append(_entry("job-a", 50, 95))
+        assert [(row.job_id, row.final_score) for row in writer.rows] == [("job-a", 95), ("job-b", 80)]
+
+    assert [line["job_id"] for line in _read_jsonl(writer.jsonl_path)] == ["job-a", "job-b", "job-a"]
+    assert _read_csv_job_ids(writer.csv_path) == ["job-a", "job-b"]
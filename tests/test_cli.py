@@ -0,0 +1,30 @@
+import pytest
+
+from src.cli import build_parser
+
+
+def test_run_defaults_to_the_job_file():
+    args = build_parser().parse_args(["run"])
+    assert args.job == "assets/input/job_file.txt"
+    assert args.url is None
+
+
+def test_run_accepts_url_instead_of_job():
+    args = build_parser().parse_args(["run", "--url", "https://example.com/job"])
+    assert args.url == "https://example.com/job"
+
+
+def test_run_rejects_job_and_url_together():
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(["run", "--job", "job.txt", "--url", "https://example.com/job"])
+
+
+def test_extract_job_rejects_file_and_url_together():
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(["extract-job", "job.txt", "--url", "https://example.com/job"])
+
+
+def test_run_governor_options():
+    args = build_parser().parse_args(["run", "--max-concurrency", "8", "--tokens-per-minute", "200000",
+                                      "--priority", "batch"])
+    assert (args.max_concurrency, args.tokens_per_minute, args.priority) == (8, 200000, "batch")
@@ -0,0 +1,140 @@
+import asyncio
+import time
+
+from src.tools.concurrency_governor import ConcurrencyGovernor, Priority, priority_lane
+from tests.fake_model import FakeRateLimitedModel
+
+
+def test_limit_settles_near_provider_capacity():
+    async def scenario():
+        model = FakeRateLimitedModel(capacity=6)
+        governor = ConcurrencyGovernor(initial_limit=2, max_limit=32, base_backoff=0.01, max_retries=50)
+        await asyncio.gather(*(governor.call(lambda i=i: model(f"job-{i}"), priority=Priority.BATCH)
+                               for i in range(300)))
+        return model, governor
+
+    model, governor = asyncio.run(scenario())
+    assert len(model.completed) == 300
+    assert model.rate_limited > 0
+    assert governor.rate_limited_count == model.rate_limited
+    assert model.peak == 6
+    assert 3 <= governor.limit <= 12
+
+
+def test_interactive_lane_goes_ahead_of_queued_batch_work():
+    async def scenario():
+        model = FakeRateLimitedModel(capacity=10)
+        governor = ConcurrencyGovernor(initial_limit=1, max_limit=1)
+
+        async def batch():
+            with priority_lane(Priority.BATCH):
+                await asyncio.gather(*(governor.call(lambda i=i: model(f"batch-{i}")) for i in range(5)))
+
+        batch_task = asyncio.create_task(batch())
+        await asyncio.sleep(0.005)
+        await asyncio.gather(*(governor.call(lambda i=i: model(f"interactive-{i}")) for i in range(2)))
+        await batch_task
+        return model.completed
+
+    completed = asyncio.run(scenario())
+    # batch-0 was already running; both interactive calls overtake the four queued batch calls
+    assert completed[:3] == ["batch-0", "interactive-0", "interactive-1"]
+    assert completed[3:] == ["batch-1", "batch-2", "batch-3", "batch-4"]
+
+
+def test_token_bucket_paces_calls():
+    async def scenario():
+        model = FakeRateLimitedModel(capacity=1000, latency=0)
+        # 24000 tokens per minute: a full bucket holds 240 calls of 100 tokens,
+        # after that it refills 400 tokens per second, i.e. one call every 0.25 s
+        governor = ConcurrencyGovernor(initial_limit=8, tokens_per_minute=24000)
+        start = time.monotonic()
+        finished_at: list[float] = []
+
+        async def one(i: int) -> None:
+            await governor.call(lambda: model(f"job-{i}"), estimated_tokens=100)
+            finished_at.append(time.monotonic() - start)
+
+        await asyncio.gather(*(one(i) for i in range(244)))
+        return finished_at
+
+    finished_at = sorted(asyncio.run(scenario()))
+    assert finished_at[239] < 0.5
+    assert 0.7 <= finished_at[-1] <= 2.0
+
+
+def test_cancelled_acquire_gives_its_slot_back():
+    async def scenario():
+        governor = ConcurrencyGovernor(initial_limit=1, max_limit=1)
+        await governor.acquire()
+
+        # cancelled while still queued
+        waiting = asyncio.create_task(governor.acquire())
+        await asyncio.sleep(0)
+        waiting.cancel()
+        await asyncio.gather(waiting, return_exceptions=True)
+        assert governor.in_flight == 1
+
+        # cancelled right after being granted the slot, before it could resume
+        granted = asyncio.create_task(governor.acquire())
+        await asyncio.sleep(0)
+        governor.release()
+        assert governor.in_flight == 1
+        granted.cancel()
+        await asyncio.gather(granted, return_exceptions=True)
+        assert governor.in_flight == 0
+
+        await asyncio.wait_for(governor.acquire(), timeout=1)
+        return governor.in_flight
+
+    assert asyncio.run(scenario()) == 1
+
+
+def test_slow_stage_does_not_count_as_latency_spike_for_fast_stage():
+    async def scenario():
+        model = FakeRateLimitedModel(capacity=10)
+        governor = ConcurrencyGovernor(initial_limit=4, max_limit=32)
+        for i in range(5):
+            await governor.call(lambda i=i: model(f"extract-{i}", latency=0.01), stage="job_profile_agent")
+        limit_before = governor.limit
+        await governor.call(lambda: model("tailor", latency=0.1), stage="tailoring_plan_agent")
+        return limit_before, governor.limit
+
+    limit_before, limit_after = asyncio.run(scenario())
+    # not backed off; the same slowdown within one stage does back off (next test)
+    assert limit_after == limit_before
+
+
+def test_latency_spike_within_a_stage_backs_off():
+    async def scenario():
+        model = FakeRateLimitedModel(capacity=10)
+        governor = ConcurrencyGovernor(initial_limit=8, max_limit=32)
+        for i in range(5):
+            await governor.call(lambda i=i: model(f"extract-{i}", latency=0.01), stage="job_profile_agent")
+        limit_before = governor.limit
+        await governor.call(lambda: model("slow", latency=0.1), stage="job_profile_agent")
+        return limit_before, governor.limit
+
+    limit_before, limit_after = asyncio.run(scenario())
+    assert limit_after < limit_before
+
+
+def test_light_load_does_not_grow_the_limit():
+    async def scenario():
+        model = FakeRateLimitedModel(capacity=10)
+        governor = ConcurrencyGovernor(initial_limit=4, max_limit=32)
+        for i in range(20):
+            await governor.call(lambda i=i: model(f"job-{i}"))
+        return governor.limit
+
+    assert asyncio.run(scenario()) == 4
+
+
+def test_saturated_healthy_load_grows_the_limit():
+    async def scenario():
+        model = FakeRateLimitedModel(capacity=100)
+        governor = ConcurrencyGovernor(initial_limit=2, max_limit=32)
+        await asyncio.gather(*(governor.call(lambda i=i: model(f"job-{i}")) for i in range(40)))
+        return governor.limit
+
+    assert asyncio.run(scenario()) > 2
@@ -0,0 +1,60 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# cumulative import time of all top-level imports, generous enough for a slow CI box but far below
+# what agents/openai/fitz/lxml cost when something imports them eagerly again
+IMPORT_TIME_BUDGET_MS = 400
+
+HEAVY_MODULES = ["agents", "fitz", "httpx", "trafilatura", "lxml"]
+
+
+def _import_time_ms(*args: str) -> float:
+    result = subprocess.run([sys.executable, "-X", "importtime", *args],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # nested imports are indented below the top-level one that pulled them in
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            total_us += int(cumulative)
+    return total_us / 1000
+
+
+def _loaded_heavy_modules(code: str) -> list[str]:
+    check = (f"import sys\n{code}\n"
+             f"print(__import__('json').dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))")
+    result = subprocess.run([sys.executable, "-c", check], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_cli_import_time_budget():
+    assert _import_time_ms("-c", "import src.cli") < IMPORT_TIME_BUDGET_MS
+
+
+@pytest.mark.parametrize("subcommand", ["extract-resume", "extract-job", "score", "tailor", "render-pdf", "run"])
+def test_subcommand_help_import_time_budget(subcommand):
+    assert _import_time_ms("main.py", subcommand, "--help") < IMPORT_TIME_BUDGET_MS
+
+
+def test_import_cli_does_not_load_heavy_modules():
+    assert _loaded_heavy_modules("import src.cli") == []
+
+
+@pytest.mark.parametrize("argv", [
+    ["render-pdf", "resume.json", "resume.pdf"],
+    ["extract-job", "assets/input/job_file.txt"],
+])
+def test_parsing_subcommand_does_not_load_heavy_modules(argv):
+    assert _loaded_heavy_modules(f"import src.cli\nsrc.cli.build_parser().parse_args({argv!r})") == []
+
+
+def test_extract_job_module_does_not_load_heavy_modules():
+    assert _loaded_heavy_modules("import src.tools.extract_job") == []
@@ -0,0 +1,93 @@
+import random
+
+from src.tools.keyword_matcher import KeywordMatcher, get_keyword_matcher
+
+
+def _canonicals(matcher: KeywordMatcher, text: str) -> list[str]:
+    return [canonical for canonical, _, _ in matcher.scan(text)]
+
+
+def test_synonyms_map_to_the_same_term():
+    matcher = KeywordMatcher(["Kubernetes", "Postgres", "Go"])
+    coverage = matcher.coverage([("b1", "Ran PostgreSQL on k8s"), ("b2", "Golang services")])
+    assert coverage.missing_keywords == []
+    assert coverage.covered_keywords == ["Kubernetes", "Postgres", "Go"]
+
+
+def test_reports_original_offsets():
+    matcher = KeywordMatcher(["machine learning"])
+    text = "Built Machine-Learning models"
+    [(canonical, start, end)] = matcher.scan(text)
+    assert canonical == "machine learning"
+    assert text[start:end] == "Machine-Learning"
+
+
+def test_whole_words_only():
+    matcher = KeywordMatcher(["Java"])
+    assert _canonicals(matcher, "JavaScript and Java") == ["java"]
+
+
+def test_overlaps_resolve_leftmost_longest():
+    matcher = KeywordMatcher(["Node.js", "JavaScript", "React", "REST API", "Redux"])
+    assert _canonicals(matcher, "Used node.js") == ["node.js"]
+    assert _canonicals(matcher, "React.js") == ["react"]
+    assert _canonicals(matcher, "restful apis") == ["rest api"]
+    assert _canonicals(matcher, "react/redux") == ["react", "redux"]
+
+
+def test_node_does_not_cover_javascript():
+    matcher = KeywordMatcher(["JavaScript"])
+    coverage = matcher.coverage([("skills", "Node.js")])
+    assert coverage.missing_keywords == ["JavaScript"]
+
+
+def test_matcher_is_cached_per_term_set():
+    assert get_keyword_matcher(("Python", "SQL")) is get_keyword_matcher(("Python", "SQL"))
+
+
+def test_matches_brute_force_on_random_text():
+    words = ["a", "ab", "b", "ba", "abc", "c", "bc", "ca"]
+    matcher = KeywordMatcher(words, synonyms={})
+    rng = random.Random(0)
+    for _ in range(500):
+        tokens = [rng.choice(words + ["x", "abca"]) for _ in range(rng.randint(0, 8))]
+        text = " ".join(tokens)
+        # expected: leftmost-longest phrase at each token position, skipping over chosen phrases
+        expected = []
+        i = 0
+        offsets = [sum(len(t) + 1 for t in tokens[:k]) for k in range(len(tokens))]
+        while i < len(tokens):
+            best = None
+            for j in range(i, len(tokens)):
+                phrase = " ".join(tokens[i:j + 1])
+                if phrase in words:
+                    best = (phrase, j)
+            if best:
+                phrase, j = best
+                expected.append((phrase, offsets[i], offsets[i] + len(phrase)))
+                i = j + 1
+            else:
+                i += 1
+        assert list(matcher.scan(text)) == expected, text
+
+
+def test_go_in_prose_is_not_golang():
+    matcher = KeywordMatcher(["Go"])
+    assert list(matcher.scan("Led go-to-market strategy")) == []
+    assert list(matcher.scan("Let's go to production")) == []
+    coverage = matcher.coverage([("b1", "Led go-to-market strategy")])
+    assert coverage.missing_keywords == ["Go"]
+
+
+def test_go_as_a_skill_item_is_golang():
+    matcher = KeywordMatcher(["Golang"])
+    coverage = matcher.coverage([("b1", "Let's go to production")], list_items=[("skills", "Go")])
+    assert coverage.covered_keywords == ["Golang"]
+    [location] = coverage.terms[0].locations
+    assert (location.source, location.matched_text) == ("skills", "Go")
+
+
+def test_continuous_practices_are_separate_terms():
+    matcher = KeywordMatcher(["Continuous Delivery", "CI/CD"])
+    coverage = matcher.coverage([("b1", "Set up continuous integration")])
+    assert coverage.missing_keywords == ["Continuous Delivery", "CI/CD"]